@@ -2,5 +2,5 @@ from __future__ import print_function, absolute_import
 from .matrixN import Matrix3, Matrix4, Matrix3Array, Matrix4Array
 from .transformation import Transformation, TransformationArray
 from .vectorN import Vector3, Vector4, Vector3Array, Vector4Array
-from .quaternion import Quaternion, QuaternionArray
+from .quaternion import Quaternion, QuaternionArray, QuaternionArraySoA
 from .euler import Euler, EulerArray
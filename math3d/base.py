@@ -44,7 +44,7 @@ class MathBase(np.ndarray):
     def __getitem__(self, idx):
         ret = super(MathBase, self).__getitem__(idx)
         typ = self.getReturnType(ret.shape, idx)
-        if typ is None:
+        if typ is None or type(ret) is typ:
             return ret
         return ret.view(typ)
 
@@ -67,7 +67,7 @@ class ArrayBase(MathBase):
                 print(idx)
                 raise
         typ = self.getReturnType(ret.shape, idx)
-        if typ is None:
+        if typ is None or type(ret) is typ:
             return ret
         return ret.view(typ)
 
@@ -87,11 +87,11 @@ class ArrayBase(MathBase):
             An iterable to be appended as-is to the end of this array
         """
         value = self._convertToCompatibleType(value)
-        newShp = list(self.shape)
-        newShp[0] += 1
-        ret = np.resize(self, newShp).view(type(self))
-        ret[-1] = value
-        return ret
+        count = len(self)
+        ret = np.empty((count + 1,) + self.shape[1:], dtype=self.dtype)
+        ret[:count] = self.view(np.ndarray)
+        ret[count] = value
+        return ret.view(type(self))
 
     def extended(self, value):
         """ Return a copy of the array extended with the given values
@@ -103,11 +103,11 @@ class ArrayBase(MathBase):
         """
         value = self._convertToCompatibleType(value)
         value = arrayCompat(value, nDim=self.ndim)
-        newShp = list(self.shape)
-        newShp[0] += len(value)
-        ret = np.resize(self, newShp).view(type(self))
-        ret[-len(value):] = value
-        return ret
+        count = len(self)
+        ret = np.empty((count + len(value),) + self.shape[1:], dtype=self.dtype)
+        ret[:count] = self.view(np.ndarray)
+        ret[count:] = value
+        return ret.view(type(self))
 
     def inserted(self, idx, value):
         """ Return a copy of the array with the value inserted at the given position
@@ -121,9 +121,9 @@ class ArrayBase(MathBase):
         """
         value = self._convertToCompatibleType(value)
         value = arrayCompat(value, nDim=self.ndim)
-        newShp = list(self.shape)
-        newShp[0] += len(value)
-        ret = np.resize(self, newShp).view(type(self))
-        ret[len(value) + idx:] = self[idx:]
+        src = self.view(np.ndarray)
+        ret = np.empty((len(self) + len(value),) + self.shape[1:], dtype=self.dtype)
+        ret[:idx] = src[:idx]
         ret[idx: len(value) + idx] = value
+        ret[len(value) + idx:] = src[idx:]
         return ret.view(type(self))
@@ -1,7 +1,206 @@
 from __future__ import print_function, absolute_import
+import math
 import numpy as np
 from .utils import arrayCompat, asarray
 from .base import MathBase, ArrayBase
+from .vectorN import VectorN, VectorNArray
+from .matrixN import MatrixN, MatrixNArray, Matrix3Array
+from .euler import Euler, EulerArray
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(fastmath=True, boundscheck=False, cache=True)
+    def _quatquatRow(p, pi, q, qi, out, i):
+        """ Write the hamilton product of p[pi] and q[qi] into out[i] """
+        px, py, pz, pw = p[pi, 0], p[pi, 1], p[pi, 2], p[pi, 3]
+        qx, qy, qz, qw = q[qi, 0], q[qi, 1], q[qi, 2], q[qi, 3]
+        out[i, 0] = pw * qx + px * qw + py * qz - pz * qy
+        out[i, 1] = pw * qy - px * qz + py * qw + pz * qx
+        out[i, 2] = pw * qz + px * qy - py * qx + pz * qw
+        out[i, 3] = pw * qw - px * qx - py * qy - pz * qz
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _quatquatKernel(p, q, out):
+        """ Single-pass hamilton product of two (N, 4) arrays into out
+        Either input may have a length of 1 to broadcast against the other
+        The lengths are not checked here, so callers must check them first
+
+        This works directly on the interleaved xyzw rows. Transposing to a
+        (4, N) layout first so LLVM can load 4 quaternions per register costs
+        more in the transposes than it saves, because this loop is memory bound
+        """
+        pStep = 1 if p.shape[0] > 1 else 0
+        qStep = 1 if q.shape[0] > 1 else 0
+        for i in prange(out.shape[0]):
+            _quatquatRow(p, i * pStep, q, i * qStep, out, i)
+
+    @njit(fastmath=True, boundscheck=False, cache=True)
+    def _quatquatKernelSerial(p, q, out):
+        """ The same as _quatquatKernel, without starting the thread pool """
+        pStep = 1 if p.shape[0] > 1 else 0
+        qStep = 1 if q.shape[0] > 1 else 0
+        for i in range(out.shape[0]):
+            _quatquatRow(p, i * pStep, q, i * qStep, out, i)
+
+    @njit(fastmath=True, boundscheck=False, cache=True)
+    def _vecquatRow(v, vi, q, qi, out, i):
+        """ Write v[vi] rotated by q[qi] into out[i] """
+        vx, vy, vz = v[vi, 0], v[vi, 1], v[vi, 2]
+        qx, qy, qz, qw = q[qi, 0], q[qi, 1], q[qi, 2], q[qi, 3]
+        # t = 2 * cross(qvec, v)
+        tx = 2.0 * (qy * vz - qz * vy)
+        ty = 2.0 * (qz * vx - qx * vz)
+        tz = 2.0 * (qx * vy - qy * vx)
+        # v + w * t + cross(qvec, t)
+        out[i, 0] = vx + qw * tx + qy * tz - qz * ty
+        out[i, 1] = vy + qw * ty + qz * tx - qx * tz
+        out[i, 2] = vz + qw * tz + qx * ty - qy * tx
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _vecquatKernel(v, q, out):
+        """ Single-pass rotation of an (N, 3) vector array by an (N, 4) quaternion array
+        Either input may have a length of 1 to broadcast against the other
+        The lengths are not checked here, so callers must check them first
+        """
+        vStep = 1 if v.shape[0] > 1 else 0
+        qStep = 1 if q.shape[0] > 1 else 0
+        for i in prange(out.shape[0]):
+            _vecquatRow(v, i * vStep, q, i * qStep, out, i)
+
+    @njit(fastmath=True, boundscheck=False, cache=True)
+    def _vecquatKernelSerial(v, q, out):
+        """ The same as _vecquatKernel, without starting the thread pool """
+        vStep = 1 if v.shape[0] > 1 else 0
+        qStep = 1 if q.shape[0] > 1 else 0
+        for i in range(out.shape[0]):
+            _vecquatRow(v, i * vStep, q, i * qStep, out, i)
+
+    @njit(fastmath=True, boundscheck=False, cache=True)
+    def _parallelTransportKernel(out, quats):
+        """ Rotate each out[i] by quats[i] and store it as out[i + 1]
+        This is a serial recurrence, so it can't be run in parallel
+        """
+        for i in range(quats.shape[0]):
+            _vecquatRow(out, i, quats, i, out, i + 1)
+
+
+# Below this many quaternions, the cost of handing the work
+# to the thread pool is more than the parallel loop saves
+_PARALLEL_MIN_COUNT = 1024
+
+
+# The hamilton product as a signed swizzle of the components of p and q
+# Output component k is the sum of sign * p[i] * q[j] for each (i, j, sign)
+# The first term of each output is always positive
+_HAMILTON_TERMS = (
+    ((3, 0, 1), (0, 3, 1), (1, 2, 1), (2, 1, -1)),
+    ((3, 1, 1), (0, 2, -1), (1, 3, 1), (2, 0, 1)),
+    ((3, 2, 1), (0, 1, 1), (1, 0, -1), (2, 3, 1)),
+    ((3, 3, 1), (0, 0, -1), (1, 1, -1), (2, 2, -1)),
+)
+
+
+def _hamiltonProduct(p, q, out):
+    """ Write the hamilton products of p and q into out, one component at a time
+    Each argument is indexed by component first, so this works on the transposes
+    of (N, 4) arrays as well as on (4, N) arrays. Either input may have a length of 1
+    """
+    tmp = np.empty(out.shape[1:], dtype=out.dtype)
+    for k, terms in enumerate(_HAMILTON_TERMS):
+        (i, j, _sign), rest = terms[0], terms[1:]
+        np.multiply(p[i], q[j], out=out[k])
+        for i, j, sign in rest:
+            np.multiply(p[i], q[j], out=tmp)
+            if sign > 0:
+                out[k] += tmp
+            else:
+                out[k] -= tmp
+
+
+def _matrixRows(q):
+    """ Get the entries of the rotation matrices of a raw (N, 4) quaternion array
+    as the rows of a (9, N) array, in row-major matrix order
+    """
+    count = len(q)
+    x, y, z, w = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+
+    # Build each matrix entry as a contiguous row re-using two scratch arrays
+    rows = np.empty((9, count), dtype=q.dtype)
+    a = np.empty(count, dtype=q.dtype)
+    b = np.empty(count, dtype=q.dtype)
+
+    xx = x * x
+    yy = y * y
+    zz = z * z
+    for idx, (p, r) in ((0, (yy, zz)), (4, (xx, zz)), (8, (xx, yy))):
+        np.add(p, r, out=a)
+        np.multiply(a, -2.0, out=a)
+        np.add(a, 1.0, out=rows[idx])
+
+    np.multiply(x, y, out=a)
+    np.multiply(w, z, out=b)
+    np.add(a, b, out=rows[1])
+    np.subtract(a, b, out=rows[3])
+
+    np.multiply(x, z, out=a)
+    np.multiply(w, y, out=b)
+    np.subtract(a, b, out=rows[2])
+    np.add(a, b, out=rows[6])
+
+    np.multiply(y, z, out=a)
+    np.multiply(w, x, out=b)
+    np.add(a, b, out=rows[5])
+    np.subtract(a, b, out=rows[7])
+
+    for idx in (1, 2, 3, 5, 6, 7):
+        rows[idx] *= 2.0
+    return rows
+
+
+# The number of quaternions slerped per tile. Small enough that the
+# working set of every intermediate pass stays resident in L2
+_SLERP_TILE_SIZE = 2048
+
+
+def _slerpTile(a, b, tVal, out, scratch):
+    """ Slerp one tile of raw (n, 4) arrays into out, using pre-allocated scratch buffers """
+    n = len(a)
+    cosHalfAngle, halfAngle, sinHalfAngle, ratioA, ratioB = [s[:n] for s in scratch[:5]]
+    tmp = scratch[5][:n]
+
+    np.einsum("ij,ij->i", a, b, out=cosHalfAngle)
+
+    # Handle floating point errors
+    np.clip(cosHalfAngle, -1.0, 1.0, out=cosHalfAngle)
+
+    # Calculate the sin values
+    np.arccos(cosHalfAngle, out=halfAngle)
+    np.multiply(cosHalfAngle, cosHalfAngle, out=sinHalfAngle)
+    np.subtract(1.0, sinHalfAngle, out=sinHalfAngle)
+    np.sqrt(sinHalfAngle, out=sinHalfAngle)
+
+    np.multiply(1.0 - tVal, halfAngle, out=ratioA)
+    np.sin(ratioA, out=ratioA)
+    np.multiply(tVal, halfAngle, out=ratioB)
+    np.sin(ratioB, out=ratioB)
+
+    # Fall back to a linear blend where the quaternions are the same
+    same = sinHalfAngle < 1.0e-12
+    sinHalfAngle[same] = 1.0
+    ratioA /= sinHalfAngle
+    ratioB /= sinHalfAngle
+    if same.any():
+        ratioA[same] = np.broadcast_to(1.0 - tVal, (n,))[same]
+        ratioB[same] = np.broadcast_to(tVal, (n,))[same]
+
+    np.multiply(a, ratioA[:, None], out=out)
+    np.multiply(b, ratioB[:, None], out=tmp)
+    out += tmp
 
 
 class Quaternion(MathBase):
@@ -100,6 +299,22 @@ class Quaternion(MathBase):
 
         return np.ndarray
 
+    def __array_wrap__(self, arr, context=None, return_scalar=False):
+        # Ufunc results only stay quaternions while they're shaped like one
+        # Anything else goes straight back to a plain ndarray or scalar
+        if arr.shape == (4,):
+            return arr if type(arr) is Quaternion else arr.view(Quaternion)
+        if return_scalar:
+            return np.ndarray.__getitem__(arr, ())
+        return arr.view(np.ndarray)
+
+    def __getitem__(self, idx):
+        # Getting a single component is always a plain scalar
+        # so skip the return type lookup
+        if type(idx) is int:
+            return np.ndarray.__getitem__(self, idx)
+        return super(Quaternion, self).__getitem__(idx)
+
     def lengthSquared(self):
         """ Return the squared length of the quaternion
 
@@ -108,7 +323,8 @@ class Quaternion(MathBase):
         float:
             The squared length of the quaternion
         """
-        return self.asArray().lengthSquared()[0]
+        x, y, z, w = self.tolist()
+        return x * x + y * y + z * z + w * w
 
     def length(self):
         """ Return the length of the quaternion
@@ -118,7 +334,7 @@ class Quaternion(MathBase):
         float:
             The length of the quaternion
         """
-        return np.sqrt(self.lengthSquared())
+        return math.sqrt(self.lengthSquared())
 
     def normal(self):
         """ Return the normalized quaternion
@@ -132,16 +348,25 @@ class Quaternion(MathBase):
 
     def normalize(self):
         """ Normalize the quaternion in-place """
-        self /= self.length()
+        x, y, z, w = self.tolist()
+        self /= math.sqrt(x * x + y * y + z * z + w * w)
 
     def __mul__(self, other):
         other = asarray(other)
         if isinstance(other, Quaternion):
-            return QuaternionArray.quatquatProduct(self[None, ...], other[None, ...])[0]
+            # Multiplying a single pair is cheaper as plain float math
+            # than the round-trip through length-1 arrays
+            px, py, pz, pw = self.tolist()
+            qx, qy, qz, qw = other.tolist()
+            return Quaternion([
+                pw * qx + px * qw + py * qz - pz * qy,
+                pw * qy - px * qz + py * qw + pz * qx,
+                pw * qz + px * qy - py * qx + pz * qw,
+                pw * qw - px * qx - py * qy - pz * qz,
+            ])
         elif isinstance(other, QuaternionArray):
-            return QuaternionArray.quatquatProduct(self[None, ...], other)
+            return QuaternionArray._quatquatProductRaw(self[None, ...], other)
 
-        from .vectorN import VectorN, VectorNArray
         if isinstance(other, (VectorN, VectorNArray)):
             raise NotImplementedError(
                 "Vectors must always be on the left side of the multiplication"
@@ -193,7 +418,6 @@ class Quaternion(MathBase):
             Define the primary and secondary axes. Must be one of these options
             ['xy', 'xz', 'yx', 'yz', 'zx', 'zy']
         """
-        from .matrixN import MatrixNArray
         mats = MatrixNArray.lookAts(look, up, axis=axis)
         return mats.asQuaternionArray()[0]
 
@@ -216,12 +440,23 @@ class Quaternion(MathBase):
 
 
 class QuaternionArray(ArrayBase):
-    """ An array of Quaternion objects """
-
-    def __new__(cls, input_array=None):
+    """ An array of Quaternion objects
+
+    Parameters
+    ----------
+    input_array : iterable, optional
+        The input value to create the quaternion array. It must be an iterable with
+        a length multiple of 4
+    dtype: np.dtype, optional
+        The floating point type to store the quaternions as. Passing np.float32 halves
+        the memory moved by the bulk operations, at the cost of precision.
+        Defaults to float (float64)
+    """
+
+    def __new__(cls, input_array=None, dtype=float):
         if input_array is None:
             input_array = np.array([])
-        ary = np.asarray(input_array, dtype=float)
+        ary = np.asarray(input_array, dtype=dtype)
         ary = ary.reshape((-1, 4))
         return ary.view(cls)
 
@@ -246,8 +481,13 @@ class QuaternionArray(ArrayBase):
         QuaternionArray
             The resulting quaternion array
         """
-
-        ret = np.array([x, y, z, w]).T
+        # Write each component straight into its column so we get a
+        # contiguous (N, 4) array without a transposed copy
+        ret = np.empty(np.broadcast(x, y, z, w).shape + (4,))
+        ret[..., 0] = x
+        ret[..., 1] = y
+        ret[..., 2] = z
+        ret[..., 3] = w
         return cls(ret)
 
     @property
@@ -286,8 +526,6 @@ class QuaternionArray(ArrayBase):
         """ Convert a value to a type compatible with
         Appending, extending, or inserting
         """
-        from .matrixN import MatrixN, MatrixNArray
-        from .euler import Euler, EulerArray
         if isinstance(value, (EulerArray, MatrixNArray)):
             return value.asQuaternionArray()
         elif isinstance(value, (Euler, MatrixN)):
@@ -319,6 +557,24 @@ class QuaternionArray(ArrayBase):
                 return Quaternion
         return np.ndarray
 
+    def __array_wrap__(self, arr, context=None, return_scalar=False):
+        # Ufunc results only stay quaternions while they're shaped like them
+        # Anything else goes straight back to a plain ndarray or scalar
+        if arr.ndim == 2 and arr.shape[1] == 4:
+            return arr if type(arr) is type(self) else arr.view(type(self))
+        if return_scalar:
+            return np.ndarray.__getitem__(arr, ())
+        return arr.view(np.ndarray)
+
+    def __getitem__(self, idx):
+        # Skip the return type lookup for the common cases
+        # of getting a single quaternion or a range of them
+        if type(idx) is int:
+            return np.ndarray.__getitem__(self, idx).view(Quaternion)
+        if type(idx) is slice:
+            return np.ndarray.__getitem__(self, idx)
+        return super(QuaternionArray, self).__getitem__(idx)
+
     def lengthSquared(self):
         """ Return the squared length of each quaternion
 
@@ -347,11 +603,21 @@ class QuaternionArray(ArrayBase):
         QuaternionArray:
             The normalized quaternions
         """
-        return self / self.length()[..., None]
+        out = np.empty_like(self, dtype=np.result_type(self.dtype, np.float32))
+        np.multiply(self, self._inverseLengths()[:, None], out=out)
+        return out
 
     def normalize(self):
         """ Normalize the quaternions in-place """
-        self /= self.length()[..., None]
+        np.multiply(self, self._inverseLengths()[:, None], out=self)
+
+    def _inverseLengths(self):
+        """ Get the reciprocal of each quaternion length, re-using a single buffer """
+        # Integer quaternions still need a floating point buffer for the lengths
+        ls = np.einsum("ij,ij->i", self, self, dtype=np.result_type(self.dtype, np.float32))
+        np.sqrt(ls, out=ls)
+        np.reciprocal(ls, out=ls)
+        return ls
 
     @classmethod
     def eye(cls, length):
@@ -396,10 +662,14 @@ class QuaternionArray(ArrayBase):
         if degrees:
             angles = np.deg2rad(angles)
         ind = "xyz".index(axisName.lower())
-        ret = cls.zeros(len(angles))
-        ret[:, 3] = np.cos(angles / 2)
-        ret[:, ind] = np.sin(angles / 2)
-        return ret
+        ret = np.empty((len(angles), 4))
+        for i in range(3):
+            if i != ind:
+                ret[:, i] = 0.0
+        halves = angles * 0.5
+        np.cos(halves, out=ret[:, 3])
+        np.sin(halves, out=ret[:, ind])
+        return cls(ret)
 
     @classmethod
     def axisAngle(cls, axes, angles, degrees=False):
@@ -421,11 +691,10 @@ class QuaternionArray(ArrayBase):
         if degrees:
             angles = np.deg2rad(angles)
         sins = np.sin(angles)
-        ret = cls.zeros(len(axes))
-
-        ret[:, :3] = axes * sins[:, None]
-        ret[:, 3] = np.cos(angles)
-        return ret
+        ret = np.empty((len(axes), 4))
+        np.multiply(axes, sins[:, None], out=ret[:, :3])
+        np.cos(angles, out=ret[:, 3])
+        return cls(ret)
 
     @classmethod
     def quatquatProduct(cls, p, q):
@@ -433,16 +702,30 @@ class QuaternionArray(ArrayBase):
         You shouldn't be calling this directly
         It provides no checks for correct inputs
         """
-        # This assumes the arrays are shaped correctly
-        p, q = arrayCompat(p, q)
-        prod = np.empty((max(p.shape[0], q.shape[0]), 4))
-        prod[:, 3] = p[:, 3] * q[:, 3] - np.sum(p[:, :3] * q[:, :3], axis=1)
-        prod[:, :3] = (
-            p[:, None, 3] * q[:, :3]
-            + q[:, None, 3] * p[:, :3]
-            + np.cross(p[:, :3], q[:, :3])
-        )
-        return cls(prod)
+        return cls._quatquatProductRaw(*arrayCompat(p, q))
+
+    @classmethod
+    def _quatquatProductRaw(cls, p, q):
+        """ The quaternion product for inputs that are already 2d (N, 4) arrays
+        Callers that have already run arrayCompat use this to skip running it again
+        """
+        p, q = p.view(np.ndarray), q.view(np.ndarray)
+        # The kernels don't check the lengths, so make sure they broadcast first
+        count = np.broadcast(p[:, 0], q[:, 0]).shape[0]
+        # Promote integer inputs, but keep float32 as float32
+        dtype = np.result_type(p, q, np.float32)
+        p = np.ascontiguousarray(p, dtype=dtype)
+        q = np.ascontiguousarray(q, dtype=dtype)
+        if njit is not None:
+            prod = np.empty((count, 4), dtype=dtype)
+            kernel = _quatquatKernel if count >= _PARALLEL_MIN_COUNT else _quatquatKernelSerial
+            kernel(p, q, prod)
+            return cls(prod, dtype=dtype)
+
+        # Build each output column straight from the input columns
+        prod = np.empty((count, 4), dtype=dtype)
+        _hamiltonProduct(p.T, q.T, prod.T)
+        return cls(prod, dtype=dtype)
 
     @staticmethod
     def vectorquatproduct(v, q):
@@ -450,21 +733,45 @@ class QuaternionArray(ArrayBase):
         You shouldn't be calling this directly
         It provides no checks for correct inputs
         """
-        # This assumes the arrays are shaped correctly
-        v, q = arrayCompat(v, q)
-        qvec = q[:, :3]
-        uv = np.cross(qvec, v)
-        uuv = np.cross(qvec, uv)
-        uv *= 2 * q[:, 3]
-        uuv *= 2
-        return v + uv + uuv
+        return QuaternionArray._vectorquatproductRaw(*arrayCompat(v, q))
+
+    @staticmethod
+    def _vectorquatproductRaw(v, q):
+        """ The vector rotation for inputs that are already 2d (N, 3) and (N, 4) arrays
+        Callers that have already run arrayCompat use this to skip running it again
+        """
+        typ = type(v)
+        # The kernels don't check the lengths, so make sure they broadcast first
+        count = np.broadcast(v[:, 0], q[:, 0]).shape[0]
+        # Promote integer inputs, but keep float32 as float32
+        dtype = np.result_type(v, q, np.float32)
+        v = np.ascontiguousarray(v.view(np.ndarray), dtype=dtype)
+        q = np.ascontiguousarray(q.view(np.ndarray), dtype=dtype)
+
+        if njit is not None:
+            out = np.empty((count, 3), dtype=dtype)
+            kernel = _vecquatKernel if count >= _PARALLEL_MIN_COUNT else _vecquatKernelSerial
+            kernel(v, q, out)
+            return out.view(typ)
+
+        # Rotating by a quaternion is the same as multiplying by its matrix
+        # so fuse building the matrix entries with the vector-matrix product
+        m = _matrixRows(q)
+        vx, vy, vz = v[:, 0], v[:, 1], v[:, 2]
+        ret = np.empty((3, count), dtype=dtype)
+        tmp = np.empty(ret.shape[1], dtype=dtype)
+        for k in range(3):
+            np.multiply(vx, m[k], out=ret[k])
+            np.multiply(vy, m[k + 3], out=tmp)
+            ret[k] += tmp
+            np.multiply(vz, m[k + 6], out=tmp)
+            ret[k] += tmp
+        return np.ascontiguousarray(ret.T).view(typ)
 
     def __mul__(self, other):
         other = arrayCompat(other)
         if isinstance(other, QuaternionArray):
-            return self.quatquatProduct(self, other)
-
-        from .vectorN import VectorN, VectorNArray
+            return self._quatquatProductRaw(self, other)
 
         if isinstance(other, (VectorN, VectorNArray)):
             raise NotImplementedError(
@@ -491,11 +798,28 @@ class QuaternionArray(ArrayBase):
         QuaternionArray:
             The looking matrices
         """
-        from .matrixN import MatrixNArray
-
         mats = MatrixNArray.lookAts(looks, ups, axis=axis)
         return mats.asQuaternionArray()
 
+    def cumulativeProduct(self):
+        """ Accumulate the rotations down the array in child * parent order, so
+        ret[i] == self[i] * self[i - 1] * ... * self[0]
+
+        This runs as a scan of log2(N) whole-array products instead of a loop
+        over each quaternion
+
+        Returns
+        -------
+        QuaternionArray:
+            The accumulated rotations
+        """
+        ret = self.view(np.ndarray).copy()
+        step = 1
+        while step < len(ret):
+            ret[step:] = self._quatquatProductRaw(ret[step:], ret[:-step])
+            step *= 2
+        return type(self)(ret, dtype=ret.dtype)
+
     def angles(self, other):
         """ Return the minimal angles between two quaternion rotations
 
@@ -510,7 +834,13 @@ class QuaternionArray(ArrayBase):
             The calculated angles
         """
         other = arrayCompat(other)
-        return 2 * np.acos(np.einsum("...ij, ...ij -> ...i", self, other))
+        ret = np.einsum("...ij, ...ij -> ...i", self, other)
+
+        # Handle floating point errors, then convert the cosines to angles in-place
+        np.clip(ret, -1.0, 1.0, out=ret)
+        np.arccos(ret, out=ret)
+        ret *= 2
+        return ret
 
     def slerp(self, other, tVal):
         """ Perform item-wise spherical linear interpolation at the given sample points
@@ -529,18 +859,25 @@ class QuaternionArray(ArrayBase):
             A quaternion array of interpolands
         """
         other = arrayCompat(other)
-        cosHalfAngle = np.einsum("...ij, ...ij -> ...i", self, other)
-
-        # Handle floating point errors
-        cosHalfAngle[abs(cosHalfAngle) >= 1.0] = 1.0
-
-        # Calculate the sin values
-        halfAngle = np.acos(cosHalfAngle)
-        sinHalfAngle = np.sqrt(1.0 - cosHalfAngle * cosHalfAngle)
-
-        ratioA = np.sin((1 - tVal) * halfAngle) / sinHalfAngle
-        ratioB = np.sin(tVal * halfAngle) / sinHalfAngle
-        return (self * ratioA) + (other * ratioB)
+        count = max(len(self), len(other))
+        a = np.broadcast_to(self.view(np.ndarray), (count, 4))
+        b = np.broadcast_to(other.view(np.ndarray), (count, 4))
+        dtype = np.result_type(a, b, np.float32)
+        tVal = np.asarray(tVal, dtype=dtype)
+        if tVal.ndim:
+            tVal = np.broadcast_to(tVal, (count,))
+
+        # Work through the arrays in tiles so each pass over the
+        # intermediate values reads from cache instead of main memory
+        tile = min(count, _SLERP_TILE_SIZE)
+        scratch = np.empty((5, tile), dtype=dtype)
+        scratch = list(scratch) + [np.empty((tile, 4), dtype=dtype)]
+        out = np.empty((count, 4), dtype=dtype)
+        for lo in range(0, count, _SLERP_TILE_SIZE):
+            hi = lo + _SLERP_TILE_SIZE
+            t = tVal[lo:hi] if tVal.ndim else tVal
+            _slerpTile(a[lo:hi], b[lo:hi], t, out[lo:hi], scratch)
+        return type(self)(out, dtype=dtype)
 
     def asEulerArray(self, order="xyz", degrees=False):
         """ Convert the quaternion to an array of Euler rotations
@@ -559,7 +896,322 @@ class QuaternionArray(ArrayBase):
         EulerArray:
             The converted orientation Array
         """
-        return self.asMatrixArray().asEulerArray(order=order, degrees=degrees)
+        # Direct conversion without building the rotation matrices
+        # Bernardes & Viollet, "Quaternion to Euler angles conversion:
+        # A direct, general and computationally efficient method" (2022)
+        (i, j, k), parity = EulerArray.ORDER_PARITY[order]
+        sign = -1.0 if parity else 1.0
+        q = self.view(np.ndarray)
+
+        a = q[:, 3] - q[:, j]
+        b = q[:, i] + q[:, k] * sign
+        c = q[:, 3] + q[:, j]
+        d = q[:, k] * sign - q[:, i]
+
+        mid = 2 * np.arctan2(np.hypot(c, d), np.hypot(a, b))
+        halfSum = np.arctan2(b, a)
+        halfDiff = np.arctan2(d, c)
+        first = halfSum - halfDiff
+        last = halfSum + halfDiff
+
+        # In gimbal lock, put all of the rotation on the first axis
+        epsilon = 1.6e-8
+        lock0 = np.abs(mid) <= epsilon
+        lockPi = np.abs(mid - np.pi) <= epsilon
+        first[lock0] = 2 * halfSum[lock0]
+        first[lockPi] = -2 * halfDiff[lockPi]
+        last[lock0 | lockPi] = 0.0
+
+        eul1 = np.empty((len(self), 3))
+        eul1[:, i] = first
+        eul1[:, j] = mid - np.pi / 2
+        eul1[:, k] = last * sign
+
+        # The other solution that represents the same orientation
+        eul2 = eul1 + np.pi
+        eul2[:, j] = np.pi - eul1[:, j]
+        eul1 = (eul1 + np.pi) % (2 * np.pi) - np.pi
+        eul2 = (eul2 + np.pi) % (2 * np.pi) - np.pi
+
+        # The "best" euler is the one with the smallest abs sum
+        d1 = np.abs(eul1).sum(axis=-1)
+        d2 = np.abs(eul2).sum(axis=-1)
+        mx = d1 > d2
+        eul1[mx] = eul2[mx]
+
+        if degrees:
+            eul1 = np.rad2deg(eul1)
+        return EulerArray(eul1, order=order, degrees=degrees)
+
+    def asMatrixArray(self):
+        """ Convert the quaternion array to a 3x3 matrix array
+
+        Returns
+        -------
+        Matrix3Array
+            The array of orientations
+        """
+        # Lay the (9, N) entries out as (N, 3, 3) in one copy
+        rows = _matrixRows(self.view(np.ndarray))
+        return Matrix3Array(np.ascontiguousarray(rows.T))
+
+    def asSoA(self):
+        """ Convert this array to a component-major QuaternionArraySoA
+
+        Returns
+        -------
+        QuaternionArraySoA
+            A copy of these quaternions stored as contiguous component rows
+        """
+        return QuaternionArraySoA(self, dtype=self.dtype)
+
+
+class QuaternionArraySoA(object):
+    """ An opt-in array of quaternions stored component-major (structure of arrays)
+
+    The data is kept as a C-ordered (4, N) array, so each of the x, y, z, and w
+    components is a contiguous row instead of a stride-4 column of a QuaternionArray.
+    This makes the component math in bulk operations read unit-stride streams
+
+    Parameters
+    ----------
+    input_array : iterable, optional
+        The quaternions to store in xyzw order. It must be an iterable with a length
+        multiple of 4, just like the input to a QuaternionArray
+    dtype: np.dtype, optional
+        The floating point type to store the quaternions as. Defaults to float (float64)
+    """
+
+    def __init__(self, input_array=None, dtype=float):
+        if input_array is None:
+            input_array = np.array([])
+        ary = np.asarray(input_array, dtype=dtype).reshape((-1, 4))
+        self._data = np.ascontiguousarray(ary.T)
+
+    @classmethod
+    def _fromData(cls, data):
+        """ Wrap an existing (4, N) array without copying it """
+        ret = cls.__new__(cls)
+        ret._data = data
+        return ret
+
+    @classmethod
+    def fromComponentArrays(cls, x, y, z, w):
+        """ Build a quaternion array from individual component arrays
+        The arrays must have the same length
+
+        Parameters
+        ----------
+        x: array
+            The array of X components of the quaternions
+        y: array
+            The array of Y components of the quaternions
+        z: array
+            The array of Z components of the quaternions
+        w: array
+            The array of W components of the quaternions
+
+        Returns
+        -------
+        QuaternionArraySoA
+            The resulting quaternion array
+        """
+        data = np.array([x, y, z, w])
+        return cls._fromData(data.astype(np.result_type(data, np.float32), copy=False))
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    @property
+    def x(self):
+        return self._data[0]
+
+    @x.setter
+    def x(self, val):
+        self._data[0] = val
+
+    @property
+    def y(self):
+        return self._data[1]
+
+    @y.setter
+    def y(self, val):
+        self._data[1] = val
+
+    @property
+    def z(self):
+        return self._data[2]
+
+    @z.setter
+    def z(self, val):
+        self._data[2] = val
+
+    @property
+    def w(self):
+        return self._data[3]
+
+    @w.setter
+    def w(self, val):
+        self._data[3] = val
+
+    def __len__(self):
+        return self._data.shape[1]
+
+    def __repr__(self):
+        data = np.array2string(self._data.T, separator=", ", prefix="QuaternionArraySoA(")
+        return "QuaternionArraySoA({0})".format(data)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self._fromData(self._data[:, idx])
+        return Quaternion(self._data[:, idx].copy())
+
+    def __setitem__(self, idx, value):
+        self._data[:, idx] = np.asarray(value, dtype=self._data.dtype).T
+
+    def asAoS(self):
+        """ Convert this array back to a regular QuaternionArray
+
+        Returns
+        -------
+        QuaternionArray
+            A copy of these quaternions stored as xyzw rows
+        """
+        return QuaternionArray(np.ascontiguousarray(self._data.T), dtype=self._data.dtype)
+
+    def asSoA(self):
+        """ Return this array. Provided for symmetry with QuaternionArray.asSoA """
+        return self
+
+    def copy(self):
+        return self._fromData(self._data.copy())
+
+    @classmethod
+    def eye(cls, length):
+        """ Alternate constructor to build an array of identity quaternions
+
+        Parameters
+        ----------
+        length: int
+            The number of quaternions to build
+        """
+        data = np.zeros((4, length))
+        data[3] = 1.0
+        return cls._fromData(data)
+
+    @classmethod
+    def alignedRotations(cls, axisName, angles, degrees=False):
+        """ An alternate constructor to build a quaternion from a basis vector and angle
+
+        Arguments
+        ---------
+        axisName: str
+            The name of the axis to rotate around: x, y, or z
+        angles: iterable
+            The angles to rotate around the named axes
+        degrees: bool, optional
+            If true, then assume the angles are in degrees instead of radians
+            Defaults to False
+        """
+        angles = np.asarray(angles, dtype=float)
+        if degrees:
+            angles = np.deg2rad(angles)
+        ind = "xyz".index(axisName.lower())
+        data = np.empty((4, len(angles)))
+        for i in range(3):
+            if i != ind:
+                data[i] = 0.0
+        halves = angles * 0.5
+        np.cos(halves, out=data[3])
+        np.sin(halves, out=data[ind])
+        return cls._fromData(data)
+
+    @classmethod
+    def axisAngle(cls, axes, angles, degrees=False):
+        """ An alternate constructor to build a quaternion from an axis and angle
+
+        Arguments
+        ---------
+        axes: Vector3Array
+            The axes for the axis angle
+        angles: iterable
+            An angle per axis
+        degrees: bool, optional
+            If true, then assume the angles are in degrees instead of radians
+            Defaults to False
+        """
+        axes = arrayCompat(axes).view(np.ndarray)
+        angles = np.asarray(angles, dtype=float)
+        if degrees:
+            angles = np.deg2rad(angles)
+        sins = np.sin(angles)
+        data = np.empty((4, len(axes)))
+        for i in range(3):
+            np.multiply(axes[:, i], sins, out=data[i])
+        np.cos(angles, out=data[3])
+        return cls._fromData(data)
+
+    def lengthSquared(self):
+        """ Return the squared length of each quaternion
+
+        Returns
+        -------
+        np.ndarray:
+            The squared lengths of the quaternions
+        """
+        return np.einsum("ij,ij->j", self._data, self._data)
+
+    def length(self):
+        """ Return the length of each quaternion
+
+        Returns
+        -------
+        np.ndarray:
+            The lengths of the quaternions
+        """
+        return np.sqrt(self.lengthSquared())
+
+    def normalize(self):
+        """ Normalize the quaternions in-place """
+        self._data *= self._inverseLengths()
+
+    def normal(self):
+        """ Return the normalized quaternions
+
+        Returns
+        -------
+        QuaternionArraySoA:
+            The normalized quaternions
+        """
+        return self._fromData(self._data * self._inverseLengths())
+
+    def _inverseLengths(self):
+        """ Get the reciprocal of each quaternion length, re-using a single buffer """
+        # Integer quaternions still need a floating point buffer for the lengths
+        dtype = np.result_type(self._data.dtype, np.float32)
+        ls = np.einsum("ij,ij->j", self._data, self._data, dtype=dtype)
+        np.sqrt(ls, out=ls)
+        np.reciprocal(ls, out=ls)
+        return ls
+
+    @classmethod
+    def quatquatProduct(cls, p, q):
+        """ A multiplication of two component-major quaternion arrays
+        You shouldn't be calling this directly
+        It provides no checks for correct inputs
+        """
+        count = np.broadcast(p._data[0], q._data[0]).shape[0]
+        prod = np.empty((4, count), dtype=np.result_type(p._data, q._data, np.float32))
+        _hamiltonProduct(p._data, q._data, prod)
+        return cls._fromData(prod)
+
+    def __mul__(self, other):
+        if isinstance(other, (Quaternion, QuaternionArray)):
+            other = QuaternionArraySoA(other, dtype=other.dtype)
+        if isinstance(other, QuaternionArraySoA):
+            return self.quatquatProduct(self, other)
+        return NotImplemented
 
     def asMatrixArray(self):
         """ Convert the quaternion array to a 3x3 matrix array
@@ -569,30 +1221,7 @@ class QuaternionArray(ArrayBase):
         Matrix3Array
             The array of orientations
         """
-        from .matrixN import Matrix3Array
-
-        q = self * np.sqrt(2)
-
-        qda = q[:, 3] * q[:, 0]
-        qdb = q[:, 3] * q[:, 1]
-        qdc = q[:, 3] * q[:, 2]
-        qaa = q[:, 0] * q[:, 0]
-        qab = q[:, 0] * q[:, 1]
-        qac = q[:, 0] * q[:, 2]
-        qbb = q[:, 1] * q[:, 1]
-        qbc = q[:, 1] * q[:, 2]
-        qcc = q[:, 2] * q[:, 2]
-
-        m = Matrix3Array.eye(len(self))
-        m[:, 0, 0] = 1.0 - qbb - qcc
-        m[:, 0, 1] = qdc + qab
-        m[:, 0, 2] = -qdb + qac
-
-        m[:, 1, 0] = -qdc + qab
-        m[:, 1, 1] = 1.0 - qaa - qcc
-        m[:, 1, 2] = qda + qbc
-
-        m[:, 2, 0] = qdb + qac
-        m[:, 2, 1] = -qda + qbc
-        m[:, 2, 2] = 1.0 - qaa - qbb
-        return m
+        # The (4, N) data transposed is the (N, 4) layout _matrixRows expects
+        # and its columns are the contiguous component rows
+        rows = _matrixRows(self._data.T)
+        return Matrix3Array(np.ascontiguousarray(rows.T))
@@ -7,9 +7,9 @@ from .utils import arrayCompat, toType, asarray
 class VectorN(MathBase):
     def __new__(cls, input_array=None):
         if input_array is None:
-            ary = np.zeros(cls.N)
-        else:
-            ary = np.asarray(input_array, dtype=float)
+            # The zeros are always the right size, so skip the size check
+            return np.zeros(cls.N).view(cls)
+        ary = np.asarray(input_array, dtype=float)
         if ary.size != cls.N:
             raise ValueError(
                 "Initializer for Vector{0} must be of length {0}".format(cls.N)
@@ -78,15 +78,37 @@ class VectorN(MathBase):
                 return VECTOR_ARRAY_BY_SIZE[shape[-1]]
         return np.ndarray
 
+    def asArray(self):
+        """ Return the array type of this object
+
+        Returns
+        -------
+        VectorNArray:
+            The current object up-cast into a length-1 array
+        """
+        # Add the leading axis without going through the __getitem__ type lookup
+        return np.ndarray.__getitem__(self, None).view(self.arrayType)
+
+    def __getitem__(self, idx):
+        ret = np.ndarray.__getitem__(self, idx)
+        # Getting a single component is always a plain scalar
+        # so skip the return type lookup
+        if type(idx) is int:
+            return ret
+        typ = self.getReturnType(ret.shape, idx)
+        if typ is None or type(ret) is typ:
+            return ret
+        return ret.view(typ)
+
     def lengthSquared(self):
-        """ Return the squared length of each vector
+        """ Return the squared length of the vector
 
         Returns
         -------
-        np.ndarray:
-            The squared lengths of the vectors
+        float:
+            The squared length of the vector
         """
-        return (self * self).sum()
+        return float(np.dot(self, self))
 
     def length(self):
         """ Return the length of each vector
@@ -137,14 +159,19 @@ class VectorN(MathBase):
         pad: float
             The padding value for expanding the vector
 
+        Returns
+        -------
+        VectorN:
+            The resized vector. If the size already matches, this is the
+            vector itself and not a copy
         """
         if n == self.N:
-            return self.copy()
-        typ = VECTOR_BY_SIZE[n]
-        ret = typ.full(pad)
-        n = min(n, self.N)
-        ret[:n] = self[:n]
-        return ret
+            return self
+        ret = np.empty(n, dtype=self.dtype)
+        m = min(n, self.N)
+        ret[:m] = self.view(np.ndarray)[:m]
+        ret[m:] = pad
+        return ret.view(VECTOR_BY_SIZE[n])
 
     def cross(self, other):
         """ Take Cross product with another vector
@@ -158,21 +185,26 @@ class VectorN(MathBase):
         -------
         VectorN:
             The result of the cross product
+
+        Raises
+        ------
+        TypeError:
+            If either vector isn't 3d
         """
-        ret = np.cross(self, other)
-        typ = self.getReturnType(ret.shape)
-        if typ is None:
-            return ret
-        return ret.view(typ).copy()
+        other = asarray(other)
+        if self.N != 3 or other.ndim == 0 or other.shape[-1] != 3:
+            raise TypeError("The cross product is only defined for 3d vectors")
+        if other.ndim != 1:
+            return self.asArray().cross(other)
+
+        ax, ay, az = self.tolist()
+        bx, by, bz = other.tolist()
+        return self._vec3Type([ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx])
 
     def dot(self, other):
         other = asarray(other)
         if isinstance(other, VectorN):
-            if self.N != other.N:
-                raise TypeError(
-                    "Cannot compute the dot of vectors with different sizes"
-                )
-            return np.dot(self, other)
+            return self._mulVector(other)
         elif isinstance(other, VectorNArray):
             if self.N != other.N:
                 raise TypeError(
@@ -181,48 +213,101 @@ class VectorN(MathBase):
             return np.einsum("ij, ij -> i", self.asArray(), other)
         raise TypeError("Cannot dot a VectorNArray with the given type")
 
-    def __mul__(self, other):
-        other = asarray(other)
-        if isinstance(other, VectorN):
-            if self.N != other.N:
-                raise TypeError(
-                    "Cannot compute the dot of vectors with different sizes"
-                )
-            return np.dot(self, other)
-        elif isinstance(other, VectorNArray):
-            if self.N != other.N:
-                raise TypeError(
-                    "Cannot compute the dot of vectors with different sizes"
-                )
-            return np.einsum("ij, ij -> i", self.asArray(), other)
+    # The __mul__ handler for each right-hand type, filled in as new types show up
+    _mulHandlers = {}
 
+    @classmethod
+    def _findMulHandler(cls, typ):
+        """ Find and cache the __mul__ handler for the given right-hand type
+        This is done lazily because the matrix and quaternion modules import this one
+        """
         from .matrixN import MatrixN, MatrixNArray
-
-        if isinstance(other, MatrixN):
-            if other.N < self.N:
-                raise TypeError("Can't mutiply a vector by a smaller matrix")
-            exp = self.asVectorSize(other.N)
-            ret = np.dot(exp, other)
-            return ret.asVectorSize(self.N)
-        elif isinstance(other, MatrixNArray):
-            if other.N < self.N:
-                raise TypeError("Can't mutiply a vector by a smaller matrix")
-            exp = self.asVectorSize(other.N)
-            ret = np.einsum("ij, ijk -> ik", exp.asArray(), other)
-            return ret.asVectorSize(self.N)
-
         from .quaternion import Quaternion, QuaternionArray
 
-        if isinstance(other, Quaternion):
-            exp = self.asVectorSize(3)
-            ret = QuaternionArray.vectorquatproduct(exp.asArray(), other.asArray())
-            return ret[0].asVectorSize(self.N)
-
-        elif isinstance(other, QuaternionArray):
-            exp = self.asVectorSize(3)
-            ret = QuaternionArray.vectorquatproduct(exp.asArray(), other)
-            return ret.asVectorSize(self.N)
+        handler = None
+        for base, func in (
+            (VectorN, VectorN._mulVector),
+            (VectorNArray, VectorN._mulVectorArray),
+            (MatrixN, VectorN._mulMatrix),
+            (MatrixNArray, VectorN._mulMatrixArray),
+            (Quaternion, VectorN._mulQuaternion),
+            (QuaternionArray, VectorN._mulQuaternionArray),
+        ):
+            if issubclass(typ, base):
+                handler = func
+                break
+        cls._mulHandlers[typ] = handler
+        return handler
+
+    def _mulVector(self, other):
+        if self.N != other.N:
+            raise TypeError(
+                "Cannot compute the dot of vectors with different sizes"
+            )
+        # At these sizes the call overhead of np.dot costs more than the math
+        # so pull the values out and do the dot product in python
+        a, b = self.tolist(), other.tolist()
+        if self.N == 3:
+            return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+        if self.N == 4:
+            return a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3]
+        if self.N == 2:
+            return a[0] * b[0] + a[1] * b[1]
+        return float(np.dot(self, other))
+
+    def _mulVectorArray(self, other):
+        if self.N != other.N:
+            raise TypeError(
+                "Cannot compute the dot of vectors with different sizes"
+            )
+        return np.einsum("ij, ij -> i", self.asArray(), other)
+
+    def _mulMatrix(self, other):
+        if other.N < self.N:
+            raise TypeError("Can't mutiply a vector by a smaller matrix")
+        exp = self.asVectorSize(other.N)
+        ret = np.dot(exp, other)
+        return ret.asVectorSize(self.N)
+
+    def _mulMatrixArray(self, other):
+        if other.N < self.N:
+            raise TypeError("Can't mutiply a vector by a smaller matrix")
+        exp = self.asVectorSize(other.N)
+        ret = np.einsum("ij, ijk -> ik", exp.asArray(), other)
+        return ret.asVectorSize(self.N)
+
+    def _mulQuaternion(self, other):
+        # Rotating a single vector is cheaper as plain python math
+        # than building the (1, 3) and (1, 4) arrays for the batched product
+        vx, vy, vz = self.asVectorSize(3).tolist()
+        qx, qy, qz, qw = other.tolist()
+        # t = 2 * cross(qvec, v)
+        tx = 2.0 * (qy * vz - qz * vy)
+        ty = 2.0 * (qz * vx - qx * vz)
+        tz = 2.0 * (qx * vy - qy * vx)
+        # v + w * t + cross(qvec, t)
+        ret = self._vec3Type([
+            vx + qw * tx + qy * tz - qz * ty,
+            vy + qw * ty + qz * tx - qx * tz,
+            vz + qw * tz + qx * ty - qy * tx,
+        ])
+        return ret.asVectorSize(self.N)
+
+    def _mulQuaternionArray(self, other):
+        exp = self.asVectorSize(3)
+        ret = other._vectorquatproductRaw(exp.asArray(), other)
+        return ret.asVectorSize(self.N)
 
+    def __mul__(self, other):
+        # Anything that isn't one of the handled types goes to the regular ndarray
+        # multiply as-is, so python scalars keep their weak dtype promotion
+        typ = type(other)
+        try:
+            handler = self._mulHandlers[typ]
+        except KeyError:
+            handler = self._findMulHandler(typ)
+        if handler is not None:
+            return handler(self, other)
         return super(VectorN, self).__mul__(other)
 
     @classmethod
@@ -244,7 +329,7 @@ class VectorN(MathBase):
             The second axis point
         """
         center, pos1, pos2 = arrayCompat(center, pos1, pos2)
-        ret = VectorNArray.planeNormals(center, pos1, pos2, normalize=normalize)
+        ret = cls._vec3ArrayType.planeNormals(center, pos1, pos2, normalize=normalize)
         return ret[0]
 
     def distance(self, other):
@@ -260,9 +345,12 @@ class VectorN(MathBase):
         np.ndarray
             The computed distances
         """
-        if isinstance(other, VectorNArray):
-            return (self.asArray() - other).length()
-        return (self - other).length()
+        # Let the subtract broadcast a single vector against an array, then sum
+        # the squares straight out of that one difference buffer
+        d = np.subtract(self, other).view(np.ndarray)
+        if d.ndim == 1:
+            return np.sqrt(np.dot(d, d))
+        return np.sqrt(np.einsum("ij,ij->i", d, d))
 
     def distanceToAxis(self, posA, posB):
         axis = posB - posA
@@ -273,10 +361,15 @@ class VectorN(MathBase):
         return np.sin(a) * hyp.length()
 
     def lerp(self, other, percent):
-        sa = self
-        if isinstance(other, VectorNArray):
-            sa = self.asArray()
-        return ((other - sa) * percent) + sa
+        # Let the subtract broadcast against an array, then finish in that buffer
+        ret = np.subtract(asarray(other), self)
+        # A percent array can broadcast the result wider, so only scale a scalar in-place
+        if np.ndim(percent):
+            ret = ret * percent
+        else:
+            ret *= percent
+        ret += self
+        return ret
 
     def angle(self, other):
         sa = self.asArray()
@@ -284,10 +377,23 @@ class VectorN(MathBase):
         return angles[0]
 
 class VectorNArray(ArrayBase):
-    def __new__(cls, input_array=None):
+    """ An array of VectorN objects
+
+    Parameters
+    ----------
+    input_array : iterable, optional
+        The input value to create the vector array. It must be an iterable with
+        a length multiple of N
+    dtype: np.dtype, optional
+        The floating point type to store the vectors as. Passing np.float32 halves
+        the memory moved by the bulk operations, at the cost of precision.
+        Defaults to float (float64)
+    """
+
+    def __new__(cls, input_array=None, dtype=float):
         if input_array is None:
             input_array = np.array([])
-        ary = np.asarray(input_array, dtype=float)
+        ary = np.asarray(input_array, dtype=dtype)
         ary = ary.reshape((-1, cls.N))
         return ary.view(cls)
 
@@ -350,6 +456,18 @@ class VectorNArray(ArrayBase):
                 return cls.itemType
         return np.ndarray
 
+    def __getitem__(self, idx):
+        # Skip the return type lookup for the common cases
+        # of getting a single vector or a range of them
+        if type(idx) is int:
+            return np.ndarray.__getitem__(self, idx).view(self.itemType)
+        if type(idx) is slice:
+            return np.ndarray.__getitem__(self, idx)
+        # Getting a single column, like the x/y/z properties do
+        if type(idx) is tuple and len(idx) == 2 and type(idx[1]) is int:
+            return np.ndarray.__getitem__(self, idx).view(np.ndarray)
+        return super(VectorNArray, self).__getitem__(idx)
+
     def lengthSquared(self):
         """ Return the squared length of each vector
 
@@ -358,7 +476,7 @@ class VectorNArray(ArrayBase):
         np.ndarray:
             The squared lengths of the vectors
         """
-        return np.einsum("...ij,...ij->...i", self, self)
+        return np.einsum("ij,ij->i", self, self)
 
     def length(self):
         """ Return the length of each vector
@@ -379,19 +497,27 @@ class VectorNArray(ArrayBase):
         VectorNArray:
             The normalized vectors
         """
-        d = self.length()
-        where = d > 1.0e-35
-        ret = self[where] / d[where, ..., None]
-        ret[~where] = 0
+        ret = np.empty_like(self, dtype=np.result_type(self.dtype, np.float32))
+        np.multiply(self, self._inverseLengths()[:, None], out=ret)
         return ret
 
     def normalize(self):
         """ Normalize the vectors in-place.
         Zero-length vectors will be set to zero """
-        d = self.length()
-        where = d > 1.0e-35
-        self[where] /= d[where, ..., None]
-        self[~where] = 0
+        np.multiply(self, self._inverseLengths()[:, None], out=self)
+
+    def _inverseLengths(self):
+        """ Get the reciprocal of each vector length, re-using a single buffer
+        Zero-length vectors get zero, so scaling by these sets them to zero
+        """
+        # Integer vectors still need a floating point buffer for the lengths
+        ls = np.einsum("ij,ij->i", self, self, dtype=np.result_type(self.dtype, np.float32))
+        np.sqrt(ls, out=ls)
+        zeros = ls <= 1.0e-35
+        ls[zeros] = 1.0
+        np.reciprocal(ls, out=ls)
+        ls[zeros] = 0.0
+        return ls
 
     @classmethod
     def zeros(cls, length):
@@ -443,14 +569,19 @@ class VectorNArray(ArrayBase):
         pad: float
             The padding value for expanding the vector
 
+        Returns
+        -------
+        VectorNArray:
+            The resized vectors. If the size already matches, this is the
+            array itself and not a copy
         """
         if n == self.N:
-            return self.copy()
-        typ = VECTOR_ARRAY_BY_SIZE[n]
-        ret = typ.full(len(self), pad)
-        n = min(n, self.N)
-        ret[:, :n] = self[:, :n]
-        return ret
+            return self
+        ret = np.empty((len(self), n), dtype=self.dtype)
+        m = min(n, self.N)
+        ret[:, :m] = self.view(np.ndarray)[:, :m]
+        ret[:, m:] = pad
+        return ret.view(VECTOR_ARRAY_BY_SIZE[n])
 
     def cross(self, other):
         """ Take Cross product with another array of vector
@@ -464,75 +595,132 @@ class VectorNArray(ArrayBase):
         -------
         VectorNArray:
             The result of the per-row cross product
+
+        Raises
+        ------
+        TypeError:
+            If either set of vectors isn't 3d
         """
         other = arrayCompat(other)
-        ret = np.cross(self, other)
-        typ = self.getReturnType(ret.shape)
-        if typ is None:
-            return ret
-        return ret.view(typ)
+        if self.N != 3 or other.shape[-1] != 3:
+            raise TypeError("The cross product is only defined for 3d vectors")
+        ret = self._cross3(self.view(np.ndarray), other.view(np.ndarray))
+        return ret.view(type(self))
+
+    @staticmethod
+    def _cross3(a, b):
+        """ Cross two raw (N, 3) arrays column by column
+        Either input may have a length of 1 to broadcast against the other
+        This skips all of the generic shape handling that np.cross does
+        """
+        a0, a1, a2 = a[:, 0], a[:, 1], a[:, 2]
+        b0, b1, b2 = b[:, 0], b[:, 1], b[:, 2]
+        count = max(len(a), len(b))
+        ret = np.empty((count, 3), dtype=np.result_type(a, b))
+        tmp = np.empty(count, dtype=ret.dtype)
+        np.multiply(a1, b2, out=ret[:, 0])
+        np.multiply(a2, b1, out=tmp)
+        ret[:, 0] -= tmp
+        np.multiply(a2, b0, out=ret[:, 1])
+        np.multiply(a0, b2, out=tmp)
+        ret[:, 1] -= tmp
+        np.multiply(a0, b1, out=ret[:, 2])
+        np.multiply(a1, b0, out=tmp)
+        ret[:, 2] -= tmp
+        return ret
 
     def dot(self, other):
         other = asarray(other)
         if isinstance(other, VectorNArray):
             if other.N != self.N:
                 raise TypeError("Can't dot vectors of different length")
-            return np.einsum("...ij,...ij->...i", self, other)
+            return np.einsum("ij,ij->i", self, other)
         elif isinstance(other, VectorN):
             if other.N != self.N:
                 raise TypeError("Can't dot vectors of different length")
             return np.dot(self, other)
         raise TypeError("Cannot dot a VectorNArray with the given type")
 
-    def __mul__(self, other):
-        other = asarray(other)
-        if isinstance(other, VectorNArray):
-            if other.N != self.N:
-                raise TypeError("Can't dot vectors of different length")
-            return np.einsum("...ij,...ij->...i", self, other)
-        elif isinstance(other, VectorN):
-            if other.N != self.N:
-                raise TypeError("Can't dot vectors of different length")
-            return np.dot(self, other)
+    # The __mul__ handler for each right-hand type, filled in as new types show up
+    _mulHandlers = {}
 
+    @classmethod
+    def _findMulHandler(cls, typ):
+        """ Find and cache the __mul__ handler for the given right-hand type
+        This is done lazily because the other modules import this one
+        """
         from .matrixN import MatrixN, MatrixNArray
-
-        if isinstance(other, MatrixN):
-            if other.N < self.N:
-                raise TypeError("Can't mutiply a vector by a smaller matrix")
-            exp = self.asVectorSize(other.N)
-            ret = np.dot(exp, other)
-            return ret.asVectorSize(self.N)
-        elif isinstance(other, MatrixNArray):
-            if other.N < self.N:
-                raise TypeError("Can't mutiply a vector by a smaller matrix")
-            exp = self.asVectorSize(other.N)
-            ret = np.einsum("...ij,...ijk->...ik", exp, other)
-            return ret.view(type(self))
-
         from .quaternion import Quaternion, QuaternionArray
-
-        if isinstance(other, Quaternion):
-            exp = self.asVectorSize(3)
-            ret = QuaternionArray.vectorquatproduct(exp, other.asArray())
-            return ret.asVectorSize(self.N)
-
-        elif isinstance(other, QuaternionArray):
-            exp = self.asVectorSize(3)
-            ret = QuaternionArray.vectorquatproduct(exp, other)
-            return ret.asVectorSize(self.N)
-
-
         from .transformation import Transformation, TransformationArray
-        if isinstance(other, Transformation):
-            a = self * other.scale.view(np.array)
-            b = a * other.rotation
-            c = b + other.translation
-            return c
 
-        elif isinstance(other, TransformationArray):
-            pass
+        handler = None
+        for base, func in (
+            (VectorNArray, VectorNArray._mulVectorArray),
+            (VectorN, VectorNArray._mulVector),
+            (MatrixN, VectorNArray._mulMatrix),
+            (MatrixNArray, VectorNArray._mulMatrixArray),
+            (Quaternion, VectorNArray._mulQuaternion),
+            (QuaternionArray, VectorNArray._mulQuaternionArray),
+            (Transformation, VectorNArray._mulTransformation),
+            (TransformationArray, None),
+        ):
+            if issubclass(typ, base):
+                handler = func
+                break
+        cls._mulHandlers[typ] = handler
+        return handler
+
+    def _mulVectorArray(self, other):
+        if other.N != self.N:
+            raise TypeError("Can't dot vectors of different length")
+        return np.einsum("ij,ij->i", self, other)
+
+    def _mulVector(self, other):
+        if other.N != self.N:
+            raise TypeError("Can't dot vectors of different length")
+        return np.dot(self, other)
+
+    def _mulMatrix(self, other):
+        if other.N < self.N:
+            raise TypeError("Can't mutiply a vector by a smaller matrix")
+        exp = self.asVectorSize(other.N)
+        ret = np.dot(exp, other)
+        return ret.asVectorSize(self.N)
+
+    def _mulMatrixArray(self, other):
+        if other.N < self.N:
+            raise TypeError("Can't mutiply a vector by a smaller matrix")
+        exp = self.asVectorSize(other.N)
+        ret = np.einsum("...ij,...ijk->...ik", exp, other)
+        return ret.view(type(self))
+
+    def _mulQuaternion(self, other):
+        exp = self.asVectorSize(3)
+        q = other.asArray()
+        ret = q._vectorquatproductRaw(exp, q)
+        return ret.asVectorSize(self.N)
+
+    def _mulQuaternionArray(self, other):
+        exp = self.asVectorSize(3)
+        ret = other._vectorquatproductRaw(exp, other)
+        return ret.asVectorSize(self.N)
+
+    def _mulTransformation(self, other):
+        a = self * other.scale.view(np.array)
+        b = a * other.rotation
+        c = b + other.translation
+        return c
 
+    def __mul__(self, other):
+        # Anything that isn't one of the handled types goes to the regular ndarray
+        # multiply as-is, so python scalars keep their weak dtype promotion
+        typ = type(other)
+        try:
+            handler = self._mulHandlers[typ]
+        except KeyError:
+            handler = self._findMulHandler(typ)
+        if handler is not None:
+            return handler(self, other)
         return super(VectorNArray, self).__mul__(other)
 
 
@@ -553,7 +741,15 @@ class VectorNArray(ArrayBase):
         typ = type(self)
         if not isinstance(other, typ):
             other = other.view(typ)
-        return np.arccos(self.normal() * other.normal())
+        # Scale the dots by the inverse lengths instead of normalizing
+        # copies of both arrays. Zero-length vectors still come out at 90 degrees
+        dots = np.einsum(
+            "ij,ij->i", self, other, dtype=np.result_type(self.dtype, other.dtype, np.float32)
+        )
+        dots *= self._inverseLengths() * other._inverseLengths()
+        # Rounding can push parallel vectors just outside the domain of arccos
+        np.clip(dots, -1.0, 1.0, out=dots)
+        return np.arccos(dots, out=dots)
 
     @classmethod
     def planeNormals(cls, centers, pos1, pos2, normalize=False, fallback=True):
@@ -578,12 +774,17 @@ class VectorNArray(ArrayBase):
             Have zero-length vectors fall back on valid values
         """
         centers, pos1, pos2 = arrayCompat(centers, pos1, pos2)
-        centers, pos1, pos2 = toType(VECTOR_ARRAY_BY_SIZE[3], centers, pos1, pos2)
+        centers, pos1, pos2 = toType(cls._vec3ArrayType, centers, pos1, pos2)
 
-        vec1 = (pos1 - centers).normal()
-        vec2 = (pos2 - centers).normal()
+        # Integer points still give floating point normals
+        dtype = np.result_type(centers, pos1, pos2, np.float32)
+        vec1 = np.subtract(pos1, centers, dtype=dtype)
+        vec2 = np.subtract(pos2, centers, dtype=dtype)
 
+        # Crossing the normalized spokes is the same as crossing the raw spokes
+        # and scaling by their inverse lengths, which skips a pass per spoke
         ret = vec2.cross(vec1)
+        ret *= (vec1._inverseLengths() * vec2._inverseLengths())[:, None]
 
         if fallback:
             # Now that we have the normals calculated, we figure out how to fall back
@@ -640,9 +841,8 @@ class VectorNArray(ArrayBase):
         np.ndarray
             The computed distances
         """
-        if other.ndim == 1:
-            other = other[None, ...]
-        return (self - other).length()
+        d = np.subtract(self, other).view(np.ndarray)
+        return np.sqrt(np.einsum("ij,ij->i", d, d))
 
     def lerp(self, other, percent):
         """ Linearly interpolate between two sets of vectors
@@ -662,7 +862,13 @@ class VectorNArray(ArrayBase):
         """
         other = arrayCompat(other)
         percent = arrayCompat(percent, nDim=1)
-        return ((other - self) * percent[..., None]) + self
+        # Do all three steps in a single output buffer
+        count = max(len(self), len(other), len(percent))
+        ret = np.empty((count, self.N), dtype=np.result_type(self, other))
+        np.subtract(other, self, out=ret)
+        np.multiply(ret, percent[:, None], out=ret)
+        np.add(ret, self, out=ret)
+        return ret.view(type(self))
 
     def parallelTransport(self, upv=None, inverse=False, endTransform=False):
         """ Take a normal and transport it along these ordered points.
@@ -683,29 +889,38 @@ class VectorNArray(ArrayBase):
         VectorNArray:
             An array of normals per point
         """
+        from . import quaternion
         from .quaternion import QuaternionArray
 
         adjVecs = self[1:] - self[:-1]
 
         # get the rotation and axis for all points except the first and last
-        binorms = adjVecs[1:].cross(adjVecs[:-1])
+        binorms = adjVecs[:-1].cross(adjVecs[1:])
 
         if upv is None:
-            upv = adjVecs[0].cross(binorms[0]).normal()
+            upv = binorms[0].cross(adjVecs[0]).normal()
 
+        # The quaternions have to be unit length for the rotations to compose
+        # axisAngle takes the sin and cos of the angles as given, so pass half angles
         angles = adjVecs[1:].angle(adjVecs[:-1])
-        if inverse:
-            angles *= -1
-        quats = QuaternionArray.axisAngle(binorms, angles)
+        angles *= -0.5 if inverse else 0.5
+        quats = QuaternionArray.axisAngle(binorms.normal(), angles)
 
         # The first upvector is the given value
         if endTransform:
-            out = VECTOR_ARRAY_BY_SIZE[3].zeros(len(self))
+            out = self._vec3ArrayType.zeros(len(self))
         else:
-            out = VECTOR_ARRAY_BY_SIZE[3].zeros(len(self) - 1)
+            out = self._vec3ArrayType.zeros(len(self) - 1)
         out[0] = upv
-        for i in range(len(self) - 2):
-            out[i + 1] = out[i] * quats[i]
+        if quaternion.njit is not None:
+            quaternion._parallelTransportKernel(
+                out.view(np.ndarray), np.ascontiguousarray(quats.view(np.ndarray))
+            )
+        elif len(quats):
+            # Each step rotates by all of the previous quaternions, so accumulate them
+            # all at once and rotate copies of the starting vector in a single pass
+            rots = quats.cumulativeProduct()
+            out[1:len(rots) + 1] = QuaternionArray.vectorquatproduct(out[:1], rots)
 
         if endTransform:
             # The last upvector is a repeat of the previous one
@@ -729,3 +944,7 @@ for n in [2, 3, 4]:
     glo[aname] = va
     VECTOR_BY_SIZE[n] = v
     VECTOR_ARRAY_BY_SIZE[n] = va
+
+# The 3d types for the methods that always work in 3d, like the plane normals
+VectorN._vec3Type = VectorNArray._vec3Type = VECTOR_BY_SIZE[3]
+VectorN._vec3ArrayType = VectorNArray._vec3ArrayType = VECTOR_ARRAY_BY_SIZE[3]
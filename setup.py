@@ -33,5 +33,6 @@ setup(
 	include_package_data=True,
 	author='Tyler Fox <tbttfox@gmail.com>',
 	install_requires=[],
+	extras_require={'numba': ['numba']},
 	author_email='tbttfox@gmail.com>',
 )
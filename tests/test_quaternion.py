@@ -0,0 +1,282 @@
+from __future__ import print_function, absolute_import
+import numpy as np
+import pytest
+
+import math3d.quaternion as quaternionModule
+from math3d import (
+    Quaternion,
+    QuaternionArray,
+    QuaternionArraySoA,
+    EulerArray,
+    Vector3Array,
+)
+
+
+def randomQuats(count, seed=0):
+    rng = np.random.default_rng(seed)
+    ret = rng.normal(size=(count, 4))
+    ret /= np.linalg.norm(ret, axis=1)[:, None]
+    return ret
+
+
+def randomVecs(count, seed=0):
+    return np.random.default_rng(seed).normal(size=(count, 3))
+
+
+def test_productMatchesMatrices():
+    p = QuaternionArray(randomQuats(20, 1))
+    q = QuaternionArray(randomQuats(20, 2))
+    # v * q0 * q1 == v * (q1 * q0), so p * q applies q first
+    mats = np.einsum("nij,njk->nik", q.asMatrixArray(), p.asMatrixArray())
+    assert np.allclose((p * q).asMatrixArray(), mats)
+    assert np.allclose(p * q[0:1], p * QuaternionArray(np.repeat(q[0:1], 20, axis=0)))
+
+
+requiresNumba = pytest.mark.skipif(
+    quaternionModule.njit is None, reason="numba is not installed"
+)
+
+# Single rows, broadcasting, and arrays long enough to split across threads
+COUNTS = [1, 7, 2000]
+
+
+def withoutNumba(monkeypatch, func):
+    """ Run func on the NumPy path """
+    with monkeypatch.context() as m:
+        m.setattr(quaternionModule, "njit", None)
+        return func()
+
+
+@requiresNumba
+@pytest.mark.parametrize("pCount, qCount", [(n, n) for n in COUNTS] + [(1, 9), (9, 1)])
+def test_quatquatProductMatchesNumpy(monkeypatch, pCount, qCount):
+    p = QuaternionArray(randomQuats(pCount, 1))
+    q = QuaternionArray(randomQuats(qCount, 2))
+    result = p * q
+    expected = withoutNumba(monkeypatch, lambda: p * q)
+    assert type(result) is type(expected) is QuaternionArray
+    assert np.allclose(result, expected)
+
+
+@requiresNumba
+@pytest.mark.parametrize("vCount, qCount", [(n, n) for n in COUNTS] + [(1, 9), (9, 1)])
+def test_vectorquatproductMatchesNumpy(monkeypatch, vCount, qCount):
+    v = Vector3Array(randomVecs(vCount, 1))
+    q = QuaternionArray(randomQuats(qCount, 2))
+    result = v * q
+    expected = withoutNumba(monkeypatch, lambda: v * q)
+    assert type(result) is type(expected) is Vector3Array
+    assert np.allclose(result, expected)
+
+
+def test_normalize():
+    quats = randomQuats(20) * np.linspace(0.5, 3.0, 20)[:, None]
+    expected = quats / np.linalg.norm(quats, axis=1)[:, None]
+    q = QuaternionArray(quats)
+    assert np.allclose(q.normal(), expected)
+    q.normalize()
+    assert np.allclose(q, expected)
+
+
+def sameRotations(a, b):
+    """ Quaternions q and -q are the same rotation """
+    a, b = np.asarray(a), np.asarray(b)
+    dots = np.abs(np.einsum("ij,ij->i", a, b))
+    return np.allclose(dots, 1.0)
+
+
+@pytest.mark.parametrize("order", sorted(EulerArray.ORDER_PARITY))
+@pytest.mark.parametrize("degrees", [False, True])
+def test_asEulerArrayRoundTrip(order, degrees):
+    quats = QuaternionArray(randomQuats(200))
+    eulers = quats.asEulerArray(order=order, degrees=degrees)
+    assert isinstance(eulers, EulerArray)
+    assert eulers.order == order
+    assert sameRotations(eulers.asQuaternionArray(), quats)
+
+
+@pytest.mark.parametrize("order", sorted(EulerArray.ORDER_PARITY))
+def test_asEulerArrayGimbalLock(order):
+    (i, j, k), parity = EulerArray.ORDER_PARITY[order]
+    angles = np.zeros((4, 3))
+    angles[:, i] = [0.3, -1.1, 0.7, 2.0]
+    angles[:, j] = [np.pi / 2, -np.pi / 2, np.pi / 2, -np.pi / 2]
+    angles[:, k] = [0.2, 0.4, -0.5, 1.0]
+    quats = EulerArray(angles, order=order).asQuaternionArray()
+    eulers = quats.asEulerArray(order=order)
+    assert np.all(np.isfinite(eulers))
+    assert sameRotations(eulers.asQuaternionArray(), quats)
+
+
+def test_growArrays():
+    quats = QuaternionArray(randomQuats(5))
+    extra = randomQuats(2, 1)
+
+    appended = quats.appended(extra[0])
+    assert type(appended) is QuaternionArray
+    assert np.allclose(appended, np.vstack([quats, extra[:1]]))
+
+    extended = quats.extended(extra)
+    assert type(extended) is QuaternionArray
+    assert np.allclose(extended, np.vstack([quats, extra]))
+
+    inserted = quats.inserted(2, extra)
+    assert type(inserted) is QuaternionArray
+    assert np.allclose(inserted, np.vstack([quats[:2], extra, quats[2:]]))
+    assert np.allclose(quats.inserted(0, extra), np.vstack([extra, quats]))
+    assert np.allclose(quats.inserted(5, extra), np.vstack([quats, extra]))
+
+
+def test_soaMatchesAoS():
+    p = QuaternionArray(randomQuats(20, 1) * 2.0)
+    q = QuaternionArray(randomQuats(20, 2))
+    sp, sq = p.asSoA(), q.asSoA()
+
+    assert np.allclose((sp * sq).asAoS(), p * q)
+    assert np.allclose((sp * q[0:1]).asAoS(), p * q[0:1])
+    assert np.allclose(sp.lengthSquared(), p.lengthSquared())
+    assert np.allclose(sp.length(), p.length())
+    assert np.allclose(sp.normal().asAoS(), p.normal())
+    assert np.allclose(sp.normal().asMatrixArray(), p.normal().asMatrixArray())
+
+    normalized = sp.copy()
+    normalized.normalize()
+    assert np.allclose(normalized.asAoS(), p.normal())
+
+    with pytest.raises(ValueError):
+        sp * QuaternionArraySoA(randomQuats(3))
+
+
+def test_soaConstructorsMatchAoS():
+    angles = np.linspace(-3.0, 3.0, 20)
+    for axis in "xyz":
+        assert np.allclose(
+            QuaternionArraySoA.alignedRotations(axis, angles).asAoS(),
+            QuaternionArray.alignedRotations(axis, angles),
+        )
+    axes = randomVecs(20)
+    assert np.allclose(
+        QuaternionArraySoA.axisAngle(axes, angles).asAoS(),
+        QuaternionArray.axisAngle(axes, angles),
+    )
+    quats = randomQuats(20)
+    assert np.allclose(QuaternionArraySoA.fromComponentArrays(*quats.T).asAoS(), quats)
+    assert np.allclose(QuaternionArraySoA.eye(3).asAoS(), QuaternionArray.eye(3))
+
+
+def test_soaIndexing():
+    quats = randomQuats(5)
+    soa = QuaternionArraySoA(quats)
+    assert len(soa) == 5
+    assert isinstance(soa[2], Quaternion)
+    assert np.allclose(soa[2], quats[2])
+    assert np.allclose(soa[1:3].asAoS(), quats[1:3])
+    soa[0] = [0, 0, 0, 1]
+    assert np.allclose(soa.w[0], 1.0)
+
+
+def test_singleProductMatchesArray():
+    p, q = Quaternion(randomQuats(1, 1)[0]), Quaternion(randomQuats(1, 2)[0])
+    result = p * q
+    assert type(result) is Quaternion
+    assert np.allclose(result, (p.asArray() * q.asArray())[0])
+
+
+def test_vectorRotationMatchesMatrices():
+    q = QuaternionArray(randomQuats(20))
+    v = Vector3Array(randomVecs(20))
+    assert np.allclose(v * q, np.einsum("ni,nij->nj", v, q.asMatrixArray()))
+
+
+@pytest.mark.parametrize("numba", [False, pytest.param(True, marks=requiresNumba)])
+def test_float32Preserved(monkeypatch, numba):
+    if not numba:
+        monkeypatch.setattr(quaternionModule, "njit", None)
+    p = QuaternionArray(randomQuats(10, 1), dtype=np.float32)
+    q = QuaternionArray(randomQuats(10, 2), dtype=np.float32)
+
+    assert p.dtype == np.float32
+    assert (p * q).dtype == np.float32
+    assert p.normal().dtype == np.float32
+    assert p.slerp(q, 0.25).dtype == np.float32
+    assert p.appended(q[0]).dtype == np.float32
+
+
+def test_arrayWrapTypes():
+    quats = QuaternionArray(randomQuats(5))
+    assert type(quats + quats) is QuaternionArray
+    assert type(np.negative(quats)) is QuaternionArray
+    assert type(np.negative(quats[0])) is Quaternion
+    assert type(np.square(quats).sum(axis=1)) is np.ndarray
+    assert type(quats.max(axis=1)) is np.ndarray
+
+
+def test_cumulativeProduct():
+    quats = QuaternionArray(randomQuats(37))
+    expected = [quats[0]]
+    for quat in quats[1:]:
+        expected.append(quat * expected[-1])
+    assert np.allclose(quats.cumulativeProduct(), expected)
+
+
+@pytest.mark.parametrize("numba", [False, pytest.param(True, marks=requiresNumba)])
+def test_mismatchedLengthsRaise(monkeypatch, numba):
+    if not numba:
+        monkeypatch.setattr(quaternionModule, "njit", None)
+    p = QuaternionArray(randomQuats(5))
+    q = QuaternionArray(randomQuats(7))
+    with pytest.raises(ValueError):
+        QuaternionArray.quatquatProduct(p, q)
+    with pytest.raises(ValueError):
+        QuaternionArray.vectorquatproduct(randomVecs(7), p)
+
+
+@pytest.mark.parametrize("numba", [False, pytest.param(True, marks=requiresNumba)])
+def test_integerInputsPromoteToFloat(monkeypatch, numba):
+    if not numba:
+        monkeypatch.setattr(quaternionModule, "njit", None)
+    prod = QuaternionArray.quatquatProduct(np.array([[0, 0, 1, 1]]), np.array([[0, 1, 0, 1]]))
+    assert prod.dtype == np.float64
+    assert np.allclose(prod, [[-1, 1, 1, 1]])
+
+    rot = QuaternionArray.vectorquatproduct(np.array([[1, 2, 3]]), np.array([[0, 0, 0, 1]]))
+    assert rot.dtype == np.float64
+    assert np.allclose(rot, [[1, 2, 3]])
+
+
+def test_soaFloat32Preserved():
+    p = QuaternionArray(randomQuats(10, 1), dtype=np.float32)
+    q = QuaternionArray(randomQuats(10, 2), dtype=np.float32)
+    soa = p.asSoA()
+    assert soa.dtype == np.float32
+    assert (soa * q.asSoA()).dtype == np.float32
+    assert (soa * q).dtype == np.float32
+    assert soa.normal().dtype == np.float32
+    assert soa.asAoS().dtype == np.float32
+    assert QuaternionArraySoA(p, dtype=np.float32)[0:2].dtype == np.float32
+
+
+def test_integerNormal():
+    quats = QuaternionArray([[0, 0, 0, 2], [0, 3, 0, 4]], dtype=int)
+    expected = [[0, 0, 0, 1], [0, 0.6, 0, 0.8]]
+    assert np.allclose(quats.normal(), expected)
+    assert np.allclose(quats.length(), [2, 5])
+
+
+def test_soaIntegerNormal():
+    quats = QuaternionArraySoA([[0, 0, 0, 2], [0, 3, 0, 4]], dtype=int)
+    assert np.allclose(quats.normal().asAoS(), [[0, 0, 0, 1], [0, 0.6, 0, 0.8]])
+
+
+@pytest.mark.parametrize("count", [3, 4, 5])
+def test_arrayWrapIgnoresLength(count):
+    quats = QuaternionArray(randomQuats(count))
+    assert type(np.square(quats).sum(axis=1)) is np.ndarray
+    assert type(quats.max(axis=1)) is np.ndarray
+    assert type(quats.sum(axis=0)) is np.ndarray
+    assert type(quats * 2.0) is QuaternionArray
+
+
+def test_cumulativeProductFloat32():
+    quats = QuaternionArray(randomQuats(9), dtype=np.float32)
+    assert quats.cumulativeProduct().dtype == np.float32
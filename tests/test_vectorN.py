@@ -0,0 +1,150 @@
+from __future__ import print_function, absolute_import
+import numpy as np
+import pytest
+
+import math3d.quaternion as quaternionModule
+from math3d import (
+    QuaternionArray,
+    Vector3,
+    Vector4,
+    Vector3Array,
+    Vector4Array,
+)
+
+
+def randomVecs(count, seed=0):
+    return np.random.default_rng(seed).normal(size=(count, 3))
+
+
+def test_normal():
+    vecs = randomVecs(20) * np.linspace(0.5, 3.0, 20)[:, None]
+    expected = vecs / np.linalg.norm(vecs, axis=1)[:, None]
+    assert np.allclose(Vector3Array(vecs).normal(), expected)
+    normalized = Vector3Array(vecs)
+    normalized.normalize()
+    assert np.allclose(normalized, expected)
+
+
+def test_zeroLengthNormal():
+    vecs = Vector3Array([[0, 0, 0], [3, 0, 4]])
+    assert np.allclose(vecs.normal(), [[0, 0, 0], [0.6, 0, 0.8]])
+    assert np.allclose(Vector3().normal(), [0, 0, 0])
+
+
+requiresNumba = pytest.mark.skipif(
+    quaternionModule.njit is None, reason="numba is not installed"
+)
+
+
+def helix(count):
+    t = np.linspace(0.0, 4.0 * np.pi, count)
+    return Vector3Array(np.stack([np.cos(t), np.sin(t), 0.3 * t], axis=-1))
+
+
+@requiresNumba
+@pytest.mark.parametrize(
+    "kwargs",
+    [{}, {"inverse": True}, {"endTransform": True}, {"upv": Vector3([0.0, 0.0, 1.0])}],
+)
+def test_parallelTransportMatchesNumpy(monkeypatch, kwargs):
+    points = helix(200)
+    result = points.parallelTransport(**kwargs)
+    with monkeypatch.context() as m:
+        m.setattr(quaternionModule, "njit", None)
+        expected = points.parallelTransport(**kwargs)
+    assert np.allclose(result, expected)
+
+
+def test_crossMatchesNumpy():
+    a, b = randomVecs(20, 1), randomVecs(20, 2)
+    assert np.allclose(Vector3Array(a).cross(b), np.cross(a, b))
+    assert np.allclose(Vector3Array(a).cross(b[:1]), np.cross(a, b[:1]))
+    assert np.allclose(Vector3(a[0]).cross(Vector3(b[0])), np.cross(a[0], b[0]))
+
+
+def test_asVectorSize():
+    vecs = Vector3Array(randomVecs(5))
+    assert vecs.asVectorSize(3) is vecs
+    vec = Vector3([1, 2, 3])
+    assert vec.asVectorSize(3) is vec
+
+    grown = vecs.asVectorSize(4)
+    assert type(grown) is Vector4Array
+    assert np.allclose(grown[:, :3], vecs)
+    assert np.allclose(grown.asVectorSize(3), vecs)
+
+
+def test_parallelTransportStaysPerpendicular():
+    points = helix(200)
+    normals = points.parallelTransport()
+    tangents = (points[1:] - points[:-1]).normal()
+    assert np.allclose(normals.length(), 1.0)
+    assert np.allclose(np.einsum("ij,ij->i", normals[1:], tangents[1:]), 0.0)
+
+
+def test_lerp():
+    a, b = randomVecs(5, 1), randomVecs(5, 2)
+    percent = np.linspace(0.0, 1.0, 5)
+    assert np.allclose(Vector3Array(a).lerp(b, 0.25), a + (b - a) * 0.25)
+    assert np.allclose(Vector3Array(a).lerp(b, percent), a + (b - a) * percent[:, None])
+    assert np.allclose(Vector3Array(a).lerp(b[:1], 0.25), a + (b[:1] - a) * 0.25)
+    assert np.allclose(Vector3(a[0]).lerp(Vector3(b[0]), 0.25), a[0] + (b[0] - a[0]) * 0.25)
+
+
+def test_float32Preserved():
+    a = Vector3Array(randomVecs(10, 1), dtype=np.float32)
+    b = Vector3Array(randomVecs(10, 2), dtype=np.float32)
+    q = QuaternionArray(np.tile([0.0, 0.0, 0.0, 1.0], (10, 1)), dtype=np.float32)
+
+    assert a.dtype == np.float32
+    assert a.lengthSquared().dtype == np.float32
+    assert a.length().dtype == np.float32
+    assert a.normal().dtype == np.float32
+    assert a.cross(b).dtype == np.float32
+    assert a.lerp(b, 0.5).dtype == np.float32
+    assert a.angle(b).dtype == np.float32
+    assert a.distances(b).dtype == np.float32
+    assert (a * 2).dtype == np.float32
+    assert (a * q).dtype == np.float32
+    assert a[1:3].dtype == np.float32
+    assert a.appended(b[0]).dtype == np.float32
+    assert a.asVectorSize(4).dtype == np.float32
+
+
+def test_crossRequires3d():
+    with pytest.raises(TypeError):
+        Vector4([1, 2, 3, 0]).cross(Vector4([0, 1, 0, 0]))
+    with pytest.raises(TypeError):
+        Vector4Array([[1, 2, 3, 0]]).cross([[0, 1, 0, 0]])
+    assert np.allclose(Vector3([1, 0, 0]).cross([0, 1, 0]), [0, 0, 1])
+
+
+def test_crossRejectsScalars():
+    with pytest.raises(TypeError):
+        Vector3([1, 2, 3]).cross(2.0)
+    with pytest.raises(TypeError):
+        Vector3Array([[1, 2, 3]]).cross(2.0)
+
+
+def test_integerInputs():
+    normal = Vector3.planeNormal([0, 0, 0], [1, 0, 0], [0, 1, 0])
+    assert type(normal) is Vector3
+    assert np.allclose(normal, [0, 0, -1])
+
+    normals = Vector3Array.planeNormals([[0, 0, 0]], [[2, 0, 0]], [[0, 3, 0]], normalize=True)
+    assert normals.dtype == np.float64
+    assert np.allclose(normals, [[0, 0, -1]])
+
+    angles = Vector3Array([[1, 0, 0]]).angle(np.array([[0, 1, 0]]))
+    assert np.allclose(angles, [np.pi / 2])
+
+    vecs = Vector3Array([[3, 0, 4]]).view(np.ndarray).astype(int).view(Vector3Array)
+    assert np.allclose(vecs.normal(), [[0.6, 0, 0.8]])
+
+
+def test_lerpBroadcastsPercent():
+    a, b = Vector3([0, 0, 0]), Vector3([1, 2, 3])
+    percent = np.linspace(0.0, 1.0, 4)[:, None]
+    result = a.lerp(b, percent)
+    assert result.shape == (4, 3)
+    assert np.allclose(result, percent * [1, 2, 3])